@@ -26,7 +26,7 @@ app = Flask(__name__,
 
 # 配置数据库
 try:
-    from web_gui.database_config import get_flask_config
+    from web_gui.database_config import get_flask_config, register_sqlite_pragmas
     from web_gui.models import db
     from web_gui.services.database_init_service import init_database
     
@@ -38,6 +38,9 @@ try:
     
     # 在首次请求时自动初始化数据库
     with app.app_context():
+        # SQLite连接调优（与create_app一致，需在首个连接建立前注册）
+        for engine in db.engines.values():
+            register_sqlite_pragmas(engine)
         init_database(app)
     
     DATABASE_INITIALIZED = True
@@ -1182,32 +1185,25 @@ os.environ['VERCEL'] = '1'
 try:
     print("🔄 开始加载API功能...")
 
-    # 导入数据库配置
-    from web_gui.database_config import get_flask_config
-
-    # 应用数据库配置
-    db_config = get_flask_config()
-    app.config.update(db_config)
-
-    print("✅ 数据库配置加载成功")
-
-    # 导入模型
     from web_gui.models import db
-    print("✅ 模型导入成功")
 
-    # 初始化数据库
-    db.init_app(app)
-    print("✅ 数据库初始化成功")
+    # 数据库已在文件开头初始化；那里失败时才在此补做配置和建表（同一应用只能init_app一次）
+    if 'sqlalchemy' not in app.extensions:
+        from web_gui.database_config import get_flask_config, register_sqlite_pragmas
+
+        app.config.update(get_flask_config())
+        db.init_app(app)
+        with app.app_context():
+            for engine in db.engines.values():
+                register_sqlite_pragmas(engine)
+            try:
+                db.create_all()
+                print("✅ 数据库表创建成功")
+            except Exception as e:
+                print(f"⚠️ 数据库表创建失败: {e}")
 
     # 在应用上下文中导入和注册API路由
     with app.app_context():
-        # 确保数据库表存在
-        try:
-            db.create_all()
-            print("✅ 数据库表创建成功")
-        except Exception as e:
-            print(f"⚠️ 数据库表创建失败: {e}")
-        
         # 导入API路由（在应用上下文中）
         from web_gui.api_routes import api_bp
         print("✅ API路由模块导入成功")